@@ -11,33 +11,64 @@ Output: JSON on stdout, exit 0 on success, exit 1 on failure
 import sys
 import re
 import json
+import mmap
 
+# Markdown code fences, compiled once at import
+_JSON_FENCE = re.compile(r'```json\s*')
+_ANY_FENCE = re.compile(r'```\s*')
 
-def extract_json(text: str) -> dict | None:
-    """Extract JSON object containing 'verdict' from text."""
-    # Strip markdown code blocks
-    text = re.sub(r'```json\s*', '', text)
-    text = re.sub(r'```\s*', '', text)
 
-    # Find balanced braces containing "verdict"
+def extract_json(text: str | bytes | mmap.mmap) -> dict | None:
+    """Extract JSON object containing 'verdict' from text.
+
+    Accepts str, or UTF-8 bytes-like input such as an mmap of the file;
+    for bytes only the chosen candidate is ever copied out and decoded.
+    """
+    if isinstance(text, str):
+        open_b, close_b, fence, verdict = '{', '}', '```', '"verdict"'
+    else:
+        open_b, close_b, fence, verdict = b'{', b'}', b'```', b'"verdict"'
+
+    # Find balanced braces containing "verdict". Jump between brace
+    # positions with find() rather than visiting every character.
     depth = 0
     start = -1
+    next_open = text.find(open_b)
+    next_close = text.find(close_b)
 
-    for i, c in enumerate(text):
-        if c == '{':
+    while next_close >= 0:
+        if 0 <= next_open < next_close:
             if depth == 0:
-                start = i
+                start = next_open
             depth += 1
-        elif c == '}':
-            depth -= 1
-            if depth == 0 and start >= 0:
+            next_open = text.find(open_b, next_open + 1)
+            continue
+
+        i = next_close
+        next_close = text.find(close_b, i + 1)
+        depth -= 1
+        if depth == 0 and start >= 0:
+            # Markdown code fences contain no braces, so they never change
+            # where a candidate starts or ends; strip them only from
+            # candidates that actually contain one
+            if text.find(fence, start, i + 1) >= 0:
+                candidate = text[start:i+1]
+                if not isinstance(candidate, str):
+                    candidate = candidate.decode('utf-8', errors='replace')
+                candidate = _JSON_FENCE.sub('', candidate)
+                candidate = _ANY_FENCE.sub('', candidate)
+                has_verdict = '"verdict"' in candidate
+            elif text.find(verdict, start, i + 1) >= 0:
                 candidate = text[start:i+1]
-                if '"verdict"' in candidate:
-                    try:
-                        return json.loads(candidate)
-                    except json.JSONDecodeError:
-                        pass
-                start = -1
+                has_verdict = True
+            else:
+                has_verdict = False
+            if has_verdict:
+                try:
+                    return json.loads(candidate)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    pass
+            start = -1
 
     return None
 
@@ -48,13 +79,20 @@ def main():
         sys.exit(2)
 
     try:
-        with open(sys.argv[1], 'r') as f:
-            text = f.read()
+        with open(sys.argv[1], 'rb') as f:
+            # Map the file rather than reading it into memory. mmap refuses
+            # empty files and non-seekable inputs; read those instead.
+            try:
+                text = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                text = f.read()
     except FileNotFoundError:
         print(f"File not found: {sys.argv[1]}", file=sys.stderr)
         sys.exit(2)
 
     result = extract_json(text)
+    if isinstance(text, mmap.mmap):
+        text.close()
 
     if result:
         print(json.dumps(result))
@@ -0,0 +1,57 @@
+"""
+Shared SSH test key for the MockSSHServer harnesses.
+
+Imported by test_nbs_chat_remote_mock.py, test_nbs_remote_edit_mock.py
+and test_nbs_remote_mocks.py, which all run from this directory.
+"""
+from __future__ import annotations
+
+import os
+import stat
+import tempfile
+from pathlib import Path
+
+
+# The test key is generated once and cached here across runs
+KEY_CACHE_DIR = Path.home() / ".cache" / "nbs-ssh-tests"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write data to path via a 0600 temp file in the same directory.
+
+    The file only appears under its final name once fully written, so an
+    interrupted run cannot leave a truncated or world-readable key behind.
+    """
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=path.name + ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, str(path))
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_or_create_key():
+    """Return (key_path, key) for the cached test key, creating it if needed."""
+    import asyncssh
+
+    key_path = KEY_CACHE_DIR / "test_key_ed25519"
+    if key_path.exists():
+        # Only chmod when needed: ssh rejects a key others can read
+        if stat.S_IMODE(key_path.stat().st_mode) != 0o600:
+            os.chmod(str(key_path), 0o600)
+        try:
+            return key_path, asyncssh.read_private_key(str(key_path))
+        except (OSError, asyncssh.KeyImportError):
+            # Unreadable or corrupt cached key: fall through and replace it
+            pass
+
+    KEY_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # Ed25519: a single scalar multiplication, where RSA-2048 needs a
+    # prime search taking hundreds of milliseconds
+    key = asyncssh.generate_private_key("ssh-ed25519")
+    # Public key first, so a private key in place always has its .pub
+    _write_atomic(key_path.with_suffix(".pub"), key.export_public_key())
+    _write_atomic(key_path, key.export_private_key())
+    return key_path, key
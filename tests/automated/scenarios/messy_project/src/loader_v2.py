@@ -4,8 +4,10 @@ Fixed the race condition from v1 by using a lock around
 the results list. Thread pool size of 4 matches CPU cores.
 Batch size of 32 was determined by benchmarking.
 """
+import os
 import threading
 from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 
 class ParallelLoader:
@@ -14,20 +16,69 @@ class ParallelLoader:
         self.batch_size = batch_size
         self.results = []
         self._lock = threading.Lock()
+        # Reused across load() calls; workers are started on demand, at
+        # most one per submitted batch, up to num_workers
+        self._executor = ThreadPoolExecutor(max_workers=num_workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown(wait=True)
 
     def _load_chunk(self, chunk_path):
-        # Simulated loading
-        data = open(chunk_path).read()
+        # Simulated loading. One pread() sized from fstat, with no file
+        # object at all; the GIL is released for the whole read
+        fd = os.open(chunk_path, os.O_RDONLY)
+        try:
+            return os.pread(fd, os.fstat(fd).st_size, 0)
+        finally:
+            os.close(fd)
+
+    def _load_batch(self, chunk_paths):
+        # Read the whole batch first, so the lock is taken once per batch
+        data = [self._load_chunk(p) for p in chunk_paths]
         with self._lock:
-            self.results.append(data)
+            self.results.extend(data)
 
     def load(self, data_dir):
         self.results = []
         chunks = self._find_chunks(data_dir)
-        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
-            executor.map(self._load_chunk, chunks)
+        # One task per batch_size chunks rather than per chunk, so the
+        # Future and queue overhead is paid once per batch
+        size = self.batch_size
+        batch = list(islice(chunks, size))
+        if len(batch) <= 1:
+            # At most one chunk: nothing to overlap, so skip the round
+            # trip through the pool
+            self._load_batch(batch)
+            return self.results
+        futures = []
+        if len(batch) < size:
+            # The whole directory fits in one batch; split it so each
+            # worker still gets a share instead of one reading it all
+            step = -(-len(batch) // self.num_workers)
+            for i in range(0, len(batch), step):
+                futures.append(self._executor.submit(self._load_batch, batch[i:i + step]))
+        else:
+            # Submit each batch as soon as the scan fills it, so reads
+            # start while the rest of the directory is still being listed
+            while batch:
+                futures.append(self._executor.submit(self._load_batch, batch))
+                batch = list(islice(chunks, size))
+        for f in futures:
+            # Re-raises any exception from the worker
+            f.result()
         return self.results
 
     def _find_chunks(self, data_dir):
-        import os
-        return [os.path.join(data_dir, f) for f in os.listdir(data_dir)]
+        # scandir gives the joined path and file type without extra
+        # stat calls, and leaves out subdirectories. A generator, so
+        # load() can start reading before the listing is complete
+        with os.scandir(data_dir) as entries:
+            for e in entries:
+                if e.is_file():
+                    yield e.path
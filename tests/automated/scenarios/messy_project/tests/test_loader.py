@@ -15,24 +15,37 @@ class TestParallelLoader(unittest.TestCase):
                 f.write(f"data_{i}")
 
     def test_loads_all_chunks(self):
-        loader = ParallelLoader(num_workers=4)
-        results = loader.load(self.test_dir)
+        with ParallelLoader(num_workers=4) as loader:
+            results = loader.load(self.test_dir)
         self.assertEqual(len(results), 10)
 
     def test_no_data_loss_under_concurrency(self):
         """Verify no race condition - all data accounted for."""
-        loader = ParallelLoader(num_workers=4)
-        results = loader.load(self.test_dir)
+        with ParallelLoader(num_workers=4) as loader:
+            results = loader.load(self.test_dir)
         # All chunks should be present
         contents = set(results)
-        expected = {f"data_{i}" for i in range(10)}
+        expected = {f"data_{i}".encode() for i in range(10)}
         self.assertEqual(contents, expected)
 
     def test_custom_worker_count(self):
-        loader = ParallelLoader(num_workers=2)
-        results = loader.load(self.test_dir)
+        with ParallelLoader(num_workers=2) as loader:
+            results = loader.load(self.test_dir)
         self.assertEqual(len(results), 10)
 
+    def test_close_shuts_down_pool(self):
+        """The worker pool is released by close() and by leaving a with block."""
+        loader = ParallelLoader(num_workers=4)
+        self.assertEqual(len(loader.load(self.test_dir)), 10)
+        loader.close()
+        with self.assertRaises(RuntimeError):
+            loader.load(self.test_dir)
+
+        with ParallelLoader(num_workers=4) as loader:
+            self.assertEqual(len(loader.load(self.test_dir)), 10)
+        with self.assertRaises(RuntimeError):
+            loader.load(self.test_dir)
+
 
 if __name__ == "__main__":
     unittest.main()
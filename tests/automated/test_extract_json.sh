@@ -0,0 +1,145 @@
+#!/bin/bash
+# Test: extract_json.py verdict extraction
+# Deterministic tests of the brace scanner and its input paths (mmap,
+# read() fallback for empty files and pipes). No AI involved.
+
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(dirname "$(dirname "$SCRIPT_DIR")")"
+EXTRACT_JSON="${PROJECT_ROOT}/bin/extract_json.py"
+
+PASS=0
+FAIL=0
+TOTAL=0
+
+check() {
+    local name="$1"
+    local result="$2"
+    TOTAL=$((TOTAL + 1))
+    if [[ "$result" == "0" ]]; then
+        echo "  PASS: $name"
+        PASS=$((PASS + 1))
+    else
+        echo "  FAIL: $name"
+        FAIL=$((FAIL + 1))
+    fi
+}
+
+# expect_output <name> <file> <expected stdout> <expected exit code>
+expect_output() {
+    local name="$1"
+    local file="$2"
+    local expected="$3"
+    local expected_rc="$4"
+    local output
+    local rc=0
+    output=$("$EXTRACT_JSON" "$file" 2>/dev/null) || rc=$?
+    if [[ "$output" == "$expected" && "$rc" -eq "$expected_rc" ]]; then
+        check "$name" "0"
+    else
+        echo "    expected (exit $expected_rc): $expected"
+        echo "    got      (exit $rc): $output"
+        check "$name" "1"
+    fi
+}
+
+TMPDIR=$(mktemp -d)
+trap "rm -rf '$TMPDIR'" EXIT
+
+NOT_FOUND='{"error": "no valid JSON found"}'
+
+echo "Test: extract_json.py"
+
+# Test 1: plain object
+echo ""
+echo "Test 1: plain object"
+printf 'Result:\n{"verdict": "PASS", "score": 3}\n' > "$TMPDIR/plain.txt"
+expect_output "plain object extracted" "$TMPDIR/plain.txt" \
+    '{"verdict": "PASS", "score": 3}' 0
+
+# Test 2: object inside a json code fence
+echo ""
+echo "Test 2: fenced input"
+printf 'Here it is:\n```json\n{"verdict": "FAIL", "reason": "missing v3"}\n```\n' > "$TMPDIR/fenced.txt"
+expect_output "fenced object extracted" "$TMPDIR/fenced.txt" \
+    '{"verdict": "FAIL", "reason": "missing v3"}' 0
+
+# Test 3: fences are stripped inside a candidate, so a "verdict" key split
+# by a fence is still found
+echo ""
+echo "Test 3: \"verdict\" split by a fence"
+printf '{"ver```dict": "PASS"}\n' > "$TMPDIR/split.txt"
+expect_output "fence inside key stripped" "$TMPDIR/split.txt" \
+    '{"verdict": "PASS"}' 0
+
+# Test 4: nested braces; an earlier object without "verdict" is skipped
+echo ""
+echo "Test 4: nested braces"
+printf 'noise {"x": 1} then {"verdict": "PASS", "d": {"a": {"b": [1, 2]}}} tail }\n' > "$TMPDIR/nested.txt"
+expect_output "outermost verdict object returned" "$TMPDIR/nested.txt" \
+    '{"verdict": "PASS", "d": {"a": {"b": [1, 2]}}}' 0
+
+# Test 5: first parseable candidate wins; invalid JSON is skipped
+echo ""
+echo "Test 5: invalid candidate skipped"
+printf '{"verdict": PASS}\n{"verdict": "PASS"}\n' > "$TMPDIR/invalid.txt"
+expect_output "invalid JSON candidate skipped" "$TMPDIR/invalid.txt" \
+    '{"verdict": "PASS"}' 0
+
+# Test 6: invalid UTF-8 around and inside candidates
+echo ""
+echo "Test 6: invalid UTF-8"
+printf '\xff\xfe garbage\n{"verdict": "PASS"}\n' > "$TMPDIR/utf8_outside.txt"
+expect_output "invalid UTF-8 outside object ignored" "$TMPDIR/utf8_outside.txt" \
+    '{"verdict": "PASS"}' 0
+printf '{"verdict": "\xff"}\n' > "$TMPDIR/utf8_inside.txt"
+expect_output "invalid UTF-8 inside object rejected" "$TMPDIR/utf8_inside.txt" \
+    "$NOT_FOUND" 1
+
+# Test 7: no verdict object
+echo ""
+echo "Test 7: no verdict"
+printf '{"score": 1}\nno json here\n' > "$TMPDIR/none.txt"
+expect_output "no verdict returns 1" "$TMPDIR/none.txt" "$NOT_FOUND" 1
+
+# Test 8: empty file (mmap refuses it; read() fallback)
+echo ""
+echo "Test 8: empty file"
+: > "$TMPDIR/empty.txt"
+expect_output "empty file returns 1" "$TMPDIR/empty.txt" "$NOT_FOUND" 1
+
+# Test 9: piped input (not seekable; read() fallback)
+echo ""
+echo "Test 9: piped input"
+rc=0
+output=$(printf '```json\n{"verdict": "PASS"}\n```\n' | "$EXTRACT_JSON" /dev/stdin 2>/dev/null) || rc=$?
+if [[ "$output" == '{"verdict": "PASS"}' && "$rc" -eq 0 ]]; then
+    check "piped input extracted" "0"
+else
+    check "piped input extracted" "1"
+fi
+
+# Test 10: usage errors return 2
+echo ""
+echo "Test 10: usage errors"
+rc=0
+"$EXTRACT_JSON" >/dev/null 2>&1 || rc=$?
+if [[ "$rc" -eq 2 ]]; then
+    check "no arguments returns 2" "0"
+else
+    check "no arguments returns 2" "1"
+fi
+rc=0
+"$EXTRACT_JSON" "$TMPDIR/does-not-exist.txt" >/dev/null 2>&1 || rc=$?
+if [[ "$rc" -eq 2 ]]; then
+    check "missing file returns 2" "0"
+else
+    check "missing file returns 2" "1"
+fi
+
+echo ""
+echo "Results: $PASS/$TOTAL passed, $FAIL failed"
+if [[ "$FAIL" -gt 0 ]]; then
+    exit 1
+fi
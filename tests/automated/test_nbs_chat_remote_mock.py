@@ -19,9 +19,7 @@ from __future__ import annotations
 
 import asyncio
 import os
-import subprocess
 import sys
-import tempfile
 from pathlib import Path
 
 # Ensure nbs-ssh is importable
@@ -29,12 +27,14 @@ NBS_SSH_SRC = Path.home() / "local" / "nbs-ssh" / "src"
 if NBS_SSH_SRC.exists():
     sys.path.insert(0, str(NBS_SSH_SRC))
 
+from _mock_ssh_key import load_or_create_key
+
 
 async def main() -> int:
     """Start MockSSHServer and run the bash test suite against it."""
     try:
         from nbs_ssh.testing.mock_server import MockServerConfig, MockSSHServer
-        import asyncssh
+        import asyncssh  # noqa: F401
     except ImportError as e:
         print(f"Error: nbs-ssh not available: {e}", file=sys.stderr)
         print("Install: pip install -e ~/local/nbs-ssh", file=sys.stderr)
@@ -56,53 +56,49 @@ async def main() -> int:
     # Get current username for SSH auth
     username = os.environ.get("USER", "test")
 
-    with tempfile.TemporaryDirectory(prefix="nbs_ssh_test_") as tmpdir:
-        tmpdir_path = Path(tmpdir)
-
-        # Generate temporary SSH key pair
-        key_path = tmpdir_path / "test_key"
-        key = asyncssh.generate_private_key("ssh-rsa", key_size=2048)
-        key.write_private_key(str(key_path))
-        key.write_public_key(str(key_path.with_suffix(".pub")))
-        os.chmod(str(key_path), 0o600)
-
-        # Get public key for server authorisation
-        pub_key = key.export_public_key()
-
-        # Configure MockSSHServer with key auth and real command execution
-        config = MockServerConfig(
-            username=username,
-            password="unused",
-            authorized_keys=[pub_key],
-            execute_commands=True,
+    key_path, key = load_or_create_key()
+
+    # Get public key for server authorisation
+    pub_key = key.export_public_key()
+
+    # Configure MockSSHServer with key auth and real command execution
+    config = MockServerConfig(
+        username=username,
+        password="unused",
+        authorized_keys=[pub_key],
+        execute_commands=True,
+    )
+
+    print(f"Starting MockSSHServer (user={username}, key auth, exec mode)...")
+    async with MockSSHServer(config) as server:
+        print(f"MockSSHServer listening on localhost:{server.port}")
+
+        # Build environment for the bash test suite
+        env = os.environ.copy()
+        env["NBS_CHAT_HOST"] = f"{username}@localhost"
+        env["NBS_CHAT_PORT"] = str(server.port)
+        env["NBS_CHAT_KEY"] = str(key_path)
+        env["NBS_CHAT_BIN"] = str(nbs_chat)
+        env["NBS_CHAT_OPTS"] = "StrictHostKeyChecking=no,UserKnownHostsFile=/dev/null"
+
+        # Run the bash test suite
+        test_script = script_dir / "test_nbs_chat_remote.sh"
+        assert test_script.exists(), f"Test script not found: {test_script}"
+
+        print(f"Running {test_script}...")
+        print()
+
+        # Async so the server's I/O keeps running on this loop meanwhile
+        proc = await asyncio.create_subprocess_exec(
+            "bash", str(test_script),
+            env=env,
         )
-
-        print(f"Starting MockSSHServer (user={username}, key auth, exec mode)...")
-        async with MockSSHServer(config) as server:
-            print(f"MockSSHServer listening on localhost:{server.port}")
-
-            # Build environment for the bash test suite
-            env = os.environ.copy()
-            env["NBS_CHAT_HOST"] = f"{username}@localhost"
-            env["NBS_CHAT_PORT"] = str(server.port)
-            env["NBS_CHAT_KEY"] = str(key_path)
-            env["NBS_CHAT_BIN"] = str(nbs_chat)
-            env["NBS_CHAT_OPTS"] = "StrictHostKeyChecking=no,UserKnownHostsFile=/dev/null"
-
-            # Run the bash test suite
-            test_script = script_dir / "test_nbs_chat_remote.sh"
-            assert test_script.exists(), f"Test script not found: {test_script}"
-
-            print(f"Running {test_script}...")
-            print()
-
-            result = subprocess.run(
-                ["bash", str(test_script)],
-                env=env,
-                timeout=120,
-            )
-
-            return result.returncode
+        try:
+            return await asyncio.wait_for(proc.wait(), timeout=120)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
 
 
 if __name__ == "__main__":
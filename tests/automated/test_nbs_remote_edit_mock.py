@@ -16,7 +16,6 @@ from __future__ import annotations
 
 import asyncio
 import os
-import subprocess
 import sys
 import tempfile
 from pathlib import Path
@@ -26,12 +25,14 @@ NBS_SSH_SRC = Path.home() / "local" / "nbs-ssh" / "src"
 if NBS_SSH_SRC.exists():
     sys.path.insert(0, str(NBS_SSH_SRC))
 
+from _mock_ssh_key import load_or_create_key
+
 
 async def main() -> int:
     """Start MockSSHServer and run the bash test suite against it."""
     try:
         from nbs_ssh.testing.mock_server import MockServerConfig, MockSSHServer
-        import asyncssh
+        import asyncssh  # noqa: F401
     except ImportError as e:
         print(f"Error: nbs-ssh not available: {e}", file=sys.stderr)
         print("Install: pip install -e ~/local/nbs-ssh", file=sys.stderr)
@@ -40,15 +41,12 @@ async def main() -> int:
     script_dir = Path(__file__).resolve().parent
     username = os.environ.get("USER", "test")
 
-    with tempfile.TemporaryDirectory(prefix="nbs_remote_edit_test_") as tmpdir:
+    # Leftover handles from the server must not turn teardown into an error
+    with tempfile.TemporaryDirectory(prefix="nbs_remote_edit_test_",
+                                     ignore_cleanup_errors=True) as tmpdir:
         tmpdir_path = Path(tmpdir)
 
-        # Generate temporary SSH key pair
-        key_path = tmpdir_path / "test_key"
-        key = asyncssh.generate_private_key("ssh-rsa", key_size=2048)
-        key.write_private_key(str(key_path))
-        key.write_public_key(str(key_path.with_suffix(".pub")))
-        os.chmod(str(key_path), 0o600)
+        key_path, key = load_or_create_key()
 
         pub_key = key.export_public_key()
 
@@ -78,13 +76,17 @@ async def main() -> int:
             print(f"Running {test_script}...")
             print()
 
-            result = subprocess.run(
-                ["bash", str(test_script)],
+            # Async so the server's I/O keeps running on this loop meanwhile
+            proc = await asyncio.create_subprocess_exec(
+                "bash", str(test_script),
                 env=env,
-                timeout=120,
             )
-
-            return result.returncode
+            try:
+                return await asyncio.wait_for(proc.wait(), timeout=120)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise
 
 
 if __name__ == "__main__":
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test harness: run both MockSSHServer harnesses concurrently.
+
+test_nbs_chat_remote_mock.py and test_nbs_remote_edit_mock.py are
+independent (separate servers, env vars and bash suites), so running
+them side by side takes as long as the slower one rather than the sum.
+Each harness runs as its own process with its own MockSSHServer; its
+output is collected and printed once it finishes, so the two suites'
+logs do not interleave.
+
+Prerequisites: as for the two harnesses it runs.
+
+Usage:
+  ~/local/nbs-ssh/venv/bin/python tests/automated/test_nbs_remote_mocks.py
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+import sys
+from pathlib import Path
+
+from _mock_ssh_key import load_or_create_key
+
+HARNESSES = [
+    "test_nbs_chat_remote_mock.py",
+    "test_nbs_remote_edit_mock.py",
+]
+
+# Each harness gives its bash suite 120s; allow for server startup on top
+HARNESS_TIMEOUT = 180
+
+
+async def run_harness(script: Path) -> tuple[int, bytes]:
+    """Run one harness to completion, returning (returncode, output)."""
+    # Own session, so a timeout can kill the harness together with its
+    # bash suite and any ssh children still holding ports
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, str(script),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        start_new_session=True,
+    )
+    try:
+        output, _ = await asyncio.wait_for(proc.communicate(), timeout=HARNESS_TIMEOUT)
+    except asyncio.TimeoutError:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        output, _ = await proc.communicate()
+        return 1, output + f"\nTimed out after {HARNESS_TIMEOUT}s\n".encode()
+    return proc.returncode, output
+
+
+async def main() -> int:
+    """Run every harness concurrently and report each one's result."""
+    try:
+        import asyncssh  # noqa: F401
+    except ImportError as e:
+        print(f"Error: nbs-ssh not available: {e}", file=sys.stderr)
+        print("Install: pip install -e ~/local/nbs-ssh", file=sys.stderr)
+        return 1
+
+    # Create the shared cached key up front; otherwise both harnesses
+    # could generate it at once and one would serve a key the other
+    # has overwritten on disk
+    load_or_create_key()
+
+    script_dir = Path(__file__).resolve().parent
+    scripts = [script_dir / name for name in HARNESSES]
+
+    print(f"Running {len(scripts)} harnesses concurrently...")
+    results = await asyncio.gather(*(run_harness(s) for s in scripts))
+
+    failed = 0
+    for script, (rc, output) in zip(scripts, results):
+        print(f"\n===== {script.name} (exit {rc}) =====")
+        sys.stdout.write(output.decode(errors="replace"))
+        if rc != 0:
+            failed += 1
+
+    print(f"\n{len(scripts) - failed}/{len(scripts)} harnesses passed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    rc = asyncio.run(main())
+    sys.exit(rc)